@@ -1,27 +1,26 @@
 import asyncio
-import json
+import hashlib
 import os
-import pickle
 import random
 import re
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from http.cookies import SimpleCookie
 
+import aiohttp
+import lxml.html
+import orjson
 import pytz
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from requestium import Keys, Session
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from seleniumrequests import Chrome
+from lxml import etree
 from utils.logger import log_message
 from utils.telegram_sender import send_telegram_message
 from utils.time_utils import get_next_market_times, sleep_until_market_open
 from utils.websocket_sender import send_ws_message
+from yarl import URL
 
 load_dotenv()
 
@@ -29,23 +28,57 @@ load_dotenv()
 HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN = os.getenv("HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN")
 HEDGEYE_SCRAPER_TELEGRAM_GRP = os.getenv("HEDGEYE_SCRAPER_TELEGRAM_GRP")
 WS_SERVER_URL = os.getenv("WS_SERVER_URL")
-
-# Load accounts from credentials file
-with open("cred/hedgeye_credentials.json", "r") as f:
-    accounts = json.load(f)
-
-options = Options()
-options.add_argument(
-    "--headless"
-)  # Comment out if you running for the first time and trying to save the sessions
-options.add_argument("--maximize-window")
-options.add_argument("--disable-search-engine-choice-screen")
-options.add_argument("--disable-extensions")
-options.add_argument("--disable-popup-blocking")
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_experimental_option("excludeSwitches", ["enable-automation"])
-
-last_alert_details = {}
+LOGIN_URL = "https://accounts.hedgeye.com/users/sign_in"
+FEED_URL = "https://app.hedgeye.com/feed_items/all"
+# Saved by aiohttp's CookieJar (pickle or JSON depending on the aiohttp version);
+# the old .pkl files hold requests cookie jars and are deliberately not reused
+SESSION_FILE = "data/hedgeye_session_{}.aiohttp"
+EDT = pytz.timezone("America/New_York")
+TS_FMT = "%Y-%m-%d %H:%M:%S %Z%z"
+POLL_INTERVAL_MIN = 0.3  # seconds
+POLL_INTERVAL_MAX = 5  # seconds
+POLL_BACKOFF_FACTOR = 1.5
+POLL_BACKOFF_AFTER = 10  # consecutive polls without a new alert
+FEED_TIMEOUT = 5  # seconds, so one stalled account can't hold up the poll cycle
+SESSION_FAILURE_THRESHOLD = 3  # consecutive failed fetches before a cool-off
+SESSION_COOLOFF_MIN = 5  # seconds
+SESSION_COOLOFF_MAX = 300  # seconds
+SEEN_ALERTS_MAX = 256
+BOT_CHALLENGE_SELECTOR = (
+    "//*[@data-sitekey] | //iframe[contains(@src, 'recaptcha')]"
+    " | //iframe[contains(@src, 'challenges.cloudflare.com')]"
+    " | //script[contains(@src, 'challenge-platform')]"
+)
+
+CREDENTIALS_FILE = "cred/hedgeye_credentials.json"
+
+# Digests of recently sent alerts, oldest first
+seen_alerts = OrderedDict()
+# Per-session validators and last parse result for conditional feed requests
+feed_cache = {}
+# Per-session consecutive fetch failures and when a cooled-off session may retry
+session_health = {}
+
+
+def class_xpath(*classes):
+    """Compile an XPath matching the first element carrying all the given classes."""
+    conditions = " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in classes
+    )
+    return etree.XPath(f"(//*[{conditions}])[1]")
+
+
+# Compiled once so the feed poll doesn't recompile selectors on every call
+ALERT_TITLE_XPATH = class_xpath("article__header")
+ALERT_PRICE_XPATH = class_xpath("currency", "se-live-or-close-price")
+CREATED_AT_XPATH = etree.XPath("(//time[@datetime])[1]/@datetime")
+AUTH_TOKEN_XPATH = etree.XPath('//input[@name="authenticity_token"]/@value')
+# Devise renders a failed sign-in as a flash message on the login page
+LOGIN_ERROR_XPATH = class_xpath("alert")
+BOT_CHALLENGE_XPATH = etree.XPath(BOT_CHALLENGE_SELECTOR)
+
+TICKER_RE = re.compile(r"\b([A-Z]{1,5})\b(?=\s*\$)")
 
 # User agent list
 user_agents = [
@@ -62,25 +95,91 @@ user_agents = [
 ]
 
 
+# Selenium is only imported by the Chrome fallback below, so the plain HTTP login
+# path never pays for loading it.
+def chrome_options():
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument(
+        "--headless"
+    )  # Comment out if you running for the first time and trying to save the sessions
+    options.add_argument("--maximize-window")
+    options.add_argument("--disable-search-engine-choice-screen")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    return options
+
+
+@lru_cache(maxsize=1)
+def get_accounts():
+    """Load the [email, password] pairs from the credentials file, once."""
+    with open(CREDENTIALS_FILE, "rb") as f:
+        accounts = orjson.loads(f.read())
+
+    if not isinstance(accounts, list) or not accounts:
+        raise ValueError(f"{CREDENTIALS_FILE} must be a non-empty list of accounts.")
+    for i, account in enumerate(accounts):
+        if not (
+            isinstance(account, list)
+            and len(account) == 2
+            and all(isinstance(value, str) and value for value in account)
+        ):
+            raise ValueError(
+                f"Account {i} in {CREDENTIALS_FILE} must be an [email, password] pair."
+            )
+    return tuple(tuple(account) for account in accounts)
+
+
+def validate_config():
+    """Fail fast on missing settings instead of in the middle of market hours."""
+    required = {
+        "HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN": HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN,
+        "HEDGEYE_SCRAPER_TELEGRAM_GRP": HEDGEYE_SCRAPER_TELEGRAM_GRP,
+        "WS_SERVER_URL": WS_SERVER_URL,
+    }
+    missing = [name for name, value in required.items() if not value]
+    if missing:
+        raise ValueError(f"Missing environment variables: {', '.join(missing)}")
+    get_accounts()
+
+
 def get_random_user_agent():
     return random.choice(user_agents)
 
 
-def random_scroll(driver):
-    """Perform random scrolling on the page."""
-    for _ in range(random.randint(2, 5)):
-        scroll_amount = random.randint(300, 600)
-        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-        time.sleep(random.uniform(1, 3))
-        scroll_amount = random.randint(-300, -100)
-        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-        time.sleep(random.uniform(1, 3))
-        driver.execute_script(f"window.scrollTo(0, 0);")
+def has_bot_challenge(driver):
+    """Check the page for a Cloudflare/reCAPTCHA challenge widget."""
+    from selenium.webdriver.common.by import By
+
+    return bool(driver.find_elements(By.XPATH, BOT_CHALLENGE_SELECTOR))
+
+
+def random_scroll(driver, max_time=3):
+    """Scroll once and give the page up to max_time seconds to settle."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    scroll_amount = random.randint(-600, 600)
+    driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_amount)
+    try:
+        WebDriverWait(driver, max_time).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        pass
 
 
 def login(driver, email, password):
-    login_url = "https://accounts.hedgeye.com/users/sign_in"
-    driver.get(login_url)
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver.get(LOGIN_URL)
 
     try:
         WebDriverWait(driver, 60).until(
@@ -90,7 +189,8 @@ def login(driver, email, password):
         log_message(f"Timeout while loading login page for {email}", "ERROR")
         return False
 
-    random_scroll(driver)
+    if has_bot_challenge(driver):
+        random_scroll(driver)
 
     try:
         email_input = WebDriverWait(driver, 10).until(
@@ -104,20 +204,21 @@ def login(driver, email, password):
         password_input.send_keys(password)
         password_input.send_keys(Keys.RETURN)
 
-        WebDriverWait(driver, 60).until(EC.url_changes(login_url))
+        WebDriverWait(driver, 60).until(EC.url_changes(LOGIN_URL))
 
-        if driver.current_url == login_url:
+        if driver.current_url == LOGIN_URL:
             retries = 30
-            while retries > 0 and driver.current_url == login_url:
+            while retries > 0 and driver.current_url == LOGIN_URL:
                 log_message(
-                    f"Login failed for {email}. Retrying with additional scrolling... Attempts left: {retries}",
+                    f"Login failed for {email}. Retrying... Attempts left: {retries}",
                     "WARNING",
                 )
-                driver.get(login_url)
+                driver.get(LOGIN_URL)
                 WebDriverWait(driver, 60).until(
                     EC.presence_of_element_located((By.ID, "user_email"))
                 )
-                random_scroll(driver)
+                if has_bot_challenge(driver):
+                    random_scroll(driver)
 
                 email_input = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.ID, "user_email"))
@@ -133,7 +234,7 @@ def login(driver, email, password):
                 password_input.send_keys(Keys.RETURN)
 
                 try:
-                    WebDriverWait(driver, 60).until(EC.url_changes(login_url))
+                    WebDriverWait(driver, 60).until(EC.url_changes(LOGIN_URL))
                 except TimeoutException:
                     retries -= 1
                     if retries == 0:
@@ -149,13 +250,273 @@ def login(driver, email, password):
         return False
 
 
-def fetch_alert_details(session):
-    response = session.get("https://app.hedgeye.com/feed_items/all")
-    soup = BeautifulSoup(response.text, "html.parser")
+def is_bot_challenge(response, tree):
+    """Check a login response for a JS/captcha challenge only a browser can pass."""
+    if response.headers.get("cf-mitigated") == "challenge":
+        return True
+    return tree is not None and bool(BOT_CHALLENGE_XPATH(tree))
+
+
+def parse_html(html):
+    try:
+        return lxml.html.fromstring(html)
+    except Exception:
+        return None
+
+
+async def login_http(session, email, password):
+    """
+    Log in by posting the sign-in form; cookies are kept in the session's jar.
+
+    :return: True on success, False if the login was rejected, or None if the
+        site answered with a JS challenge and a real browser is needed
+    """
+    try:
+        async with session.get(LOGIN_URL) as response:
+            tree = parse_html(await response.text())
+            if is_bot_challenge(response, tree):
+                log_message(f"Login page for {email} is behind a challenge", "WARNING")
+                return None
+        token = AUTH_TOKEN_XPATH(tree) if tree is not None else []
+        if not token:
+            log_message(f"No authenticity_token on login page for {email}", "WARNING")
+            return None
+
+        payload = {
+            "authenticity_token": token[0],
+            "user[email]": email,
+            "user[password]": password,
+        }
+        async with session.post(LOGIN_URL, data=payload) as response:
+            tree = parse_html(await response.text())
+            if is_bot_challenge(response, tree):
+                log_message(f"Login for {email} was challenged", "WARNING")
+                return None
+            if response.status < 400 and response.url.path != URL(LOGIN_URL).path:
+                return True
+
+            error = LOGIN_ERROR_XPATH(tree) if tree is not None else []
+            reason = element_text(error[0]) if error else f"HTTP {response.status}"
+            log_message(f"HTTP login failed for {email}: {reason}", "ERROR")
+            return False
+    except Exception as e:
+        log_message(f"Error during HTTP login for {email}: {str(e)}", "ERROR")
+        return False
+
+
+def transfer_driver_cookies(driver_cookies, session):
+    for cookie in driver_cookies:
+        name = cookie["name"]
+        cookies = SimpleCookie()
+        cookies[name] = cookie["value"]
+        cookies[name]["domain"] = cookie["domain"]
+        cookies[name]["path"] = cookie.get("path", "/")
+        session.cookie_jar.update_cookies(
+            cookies, response_url=URL(f"https://{cookie['domain'].lstrip('.')}")
+        )
+
+
+@contextmanager
+def chrome_driver():
+    from seleniumrequests import Chrome
+
+    driver = Chrome(options=chrome_options())
     try:
-        alert_title = soup.select_one(".article__header")
+        driver.set_page_load_timeout(1200)
+        yield driver
+    finally:
+        driver.quit()
+
+
+def login_selenium(pending):
+    """
+    Log the challenged accounts in through one shared Chrome.
+
+    Blocking; run it in a worker thread. Returns the driver cookies per logged-in
+    account so the aiohttp cookie jars are only touched from the event loop.
+    """
+    logged_in = []
+    with chrome_driver() as driver:
+        for i, session, email, password in pending:
+            try:
+                driver.delete_all_cookies()
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                if login(driver, email, password):
+                    logged_in.append((i, session, email, driver.get_cookies()))
+                else:
+                    log_message(f"Failed to login for account {i}: {email}", "ERROR")
+            except Exception as e:
+                log_message(
+                    f"Error during Chrome login for account {i}: {email}: {str(e)}",
+                    "ERROR",
+                )
+    return logged_in
+
+
+def create_session(connector):
+    return aiohttp.ClientSession(
+        connector=connector,
+        connector_owner=False,
+        cookie_jar=aiohttp.CookieJar(),
+        headers={"User-Agent": get_random_user_agent()},
+    )
+
+
+async def login_account(session, i, email, password):
+    session_filename = SESSION_FILE.format(i)
+
+    if os.path.exists(session_filename):
+        try:
+            session.cookie_jar.load(session_filename)
+            log_message(f"Loaded session for account {i}: {email}", "INFO")
+            return True
+        except Exception as e:
+            log_message(f"Failed to load session for {email}: {str(e)}", "ERROR")
+
+    session.cookie_jar.clear()
+    logged_in = await login_http(session, email, password)
+    if logged_in:
+        session.cookie_jar.save(session_filename)
+        log_message(f"Logged in and saved session for account {i}: {email}", "INFO")
+    elif logged_in is False:
+        log_message(f"Failed to login for account {i}: {email}", "ERROR")
+    return logged_in
+
+
+async def login_accounts(account_sessions):
+    results = await asyncio.gather(
+        *[
+            login_account(session, i, email, password)
+            for i, (session, (email, password)) in enumerate(
+                zip(account_sessions, get_accounts())
+            )
+        ]
+    )
+    sessions = [session for session, ok in zip(account_sessions, results) if ok]
+
+    # Chrome is only worth starting for accounts the site challenged
+    pending = [
+        (i, session, email, password)
+        for i, (session, (email, password), ok) in enumerate(
+            zip(account_sessions, get_accounts(), results)
+        )
+        if ok is None
+    ]
+    if pending:
+        log_message(f"Falling back to Chrome login for {len(pending)} account(s)")
+        try:
+            logged_in = await asyncio.to_thread(login_selenium, pending)
+        except Exception as e:
+            log_message(f"Chrome login failed: {str(e)}", "ERROR")
+            logged_in = []
+
+        for i, session, email, driver_cookies in logged_in:
+            transfer_driver_cookies(driver_cookies, session)
+            session.cookie_jar.save(SESSION_FILE.format(i))
+            log_message(f"Logged in and saved session for account {i}: {email}", "INFO")
+            sessions.append(session)
+    return sessions
+
+
+def element_text(element):
+    """Join the stripped text nodes, matching BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+async def fetch_alert_details(session):
+    """Fetch the feed, skipping the parse when the page is unchanged since last poll."""
+    cache = feed_cache.setdefault(session, {})
+    headers = {"User-Agent": get_random_user_agent()}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
+
+    async with session.get(
+        FEED_URL, headers=headers, timeout=aiohttp.ClientTimeout(total=FEED_TIMEOUT)
+    ) as response:
+        if response.status == 304:
+            return cache.get("alert_details")
+        response.raise_for_status()
+        body = await response.read()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+    # Without validators from the server, fall back to comparing body digests
+    digest = None
+    if not etag and not last_modified:
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if "alert_details" in cache and digest == cache.get("digest"):
+            return cache["alert_details"]
+
+    # Parse in a worker thread so a large page can't stall the alert sends
+    alert_details = await asyncio.to_thread(parse_alert_details, body)
+
+    # Only remember this page once it parsed, so a failed parse is retried next poll
+    cache["etag"] = etag
+    cache["last_modified"] = last_modified
+    cache["digest"] = digest
+    cache["alert_details"] = alert_details
+    return alert_details
+
+
+def session_available(session):
+    health = session_health.get(session)
+    return health is None or time.monotonic() >= health["retry_at"]
+
+
+def record_session_result(session, account, error=None):
+    """Track consecutive failures and back off exponentially on a failing session."""
+    health = session_health.setdefault(session, {"failures": 0, "retry_at": 0})
+    if error is None:
+        health["failures"] = 0
+        return
+
+    health["failures"] += 1
+    log_message(
+        f"Error fetching alerts for account {account}: {type(error).__name__}: {error}",
+        "ERROR",
+    )
+    if health["failures"] >= SESSION_FAILURE_THRESHOLD:
+        cooloff = min(
+            SESSION_COOLOFF_MIN * 2 ** (health["failures"] - SESSION_FAILURE_THRESHOLD),
+            SESSION_COOLOFF_MAX,
+        )
+        health["retry_at"] = time.monotonic() + cooloff
+        log_message(
+            f"Account {account} failed {health['failures']} times in a row, "
+            f"pausing it for {cooloff} seconds",
+            "WARNING",
+        )
+
+
+def is_new_alert(alert_details):
+    """Record the alert and report whether it was not among the recently seen ones."""
+    key = hashlib.blake2b(
+        f"{alert_details['title']}|{alert_details['created_at']}".encode(),
+        digest_size=8,
+    ).digest()
+    if key in seen_alerts:
+        seen_alerts.move_to_end(key)
+        return False
+
+    seen_alerts[key] = None
+    if len(seen_alerts) > SEEN_ALERTS_MAX:
+        seen_alerts.popitem(last=False)
+    return True
+
+
+def parse_alert_details(body):
+    try:
+        tree = lxml.html.fromstring(body)
+    except Exception as e:
+        log_message(f"Failed to parse feed page: {e}", "ERROR")
+        return None
+
+    try:
+        alert_title = ALERT_TITLE_XPATH(tree)
         if alert_title:
-            alert_title = alert_title.get_text(strip=True)
+            alert_title = element_text(alert_title[0])
         else:
             return None
     except Exception as e:
@@ -163,9 +524,9 @@ def fetch_alert_details(session):
         return None
 
     try:
-        alert_price = soup.select_one(".currency.se-live-or-close-price")
+        alert_price = ALERT_PRICE_XPATH(tree)
         if alert_price:
-            alert_price = alert_price.get_text(strip=True)
+            alert_price = element_text(alert_price[0])
         else:
             return None
     except Exception as e:
@@ -173,45 +534,36 @@ def fetch_alert_details(session):
         return None
 
     try:
-        created_at_utc = soup.select_one("time[datetime]")["datetime"]
+        created_at_utc = CREATED_AT_XPATH(tree)[0]
     except Exception as e:
         log_message(f"Failed to fetch or parse created_at_utc: {e}", "ERROR")
         return None
-    created_at = datetime.fromisoformat(created_at_utc.replace("Z", "+00:00"))
-    edt = pytz.timezone("America/New_York")
-    created_at_edt = created_at.astimezone(edt)
-    current_time_edt = datetime.now(pytz.utc).astimezone(edt)
+    if created_at_utc.endswith("Z"):
+        created_at_utc = created_at_utc[:-1] + "+00:00"
+    created_at_edt = datetime.fromisoformat(created_at_utc).astimezone(EDT)
+    current_time_edt = datetime.now(EDT)
 
     return {
         "title": alert_title,
         "price": alert_price,
-        "created_at": created_at_edt.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-        "current_time": current_time_edt.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
+        "created_at": created_at_edt.strftime(TS_FMT),
+        "current_time": current_time_edt.strftime(TS_FMT),
     }
 
 
-def save_session(session, filename):
-    with open(filename, "wb") as f:
-        pickle.dump(session.cookies, f)
-
-
-def load_session(filename):
-    with open(filename, "rb") as f:
-        return pickle.load(f)
-
-
-async def monitor_feeds_async():
-    global last_alert_details
+async def monitor_feeds_async(account_sessions):
     market_is_open = False
     logged_in = False
     first_time_ever = True
     sessions = []
+    poll_interval = POLL_INTERVAL_MIN
+    unchanged_polls = 0
 
     while True:
         pre_market_login_time, market_open_time, market_close_time = (
             get_next_market_times()
         )
-        current_time_edt = datetime.now(pytz.timezone("America/New_York"))
+        current_time_edt = datetime.now(EDT)
 
         if (
             pre_market_login_time <= current_time_edt < market_open_time
@@ -221,58 +573,7 @@ async def monitor_feeds_async():
             if not logged_in:
                 log_message("Logging in or loading sessions...", "INFO")
 
-                for i, (email, password) in enumerate(accounts):
-                    session_filename = f"data/hedgeye_session_{i}.pkl"
-
-                    if os.path.exists(session_filename):
-                        try:
-                            cookies = load_session(session_filename)
-                            driver = Chrome(options=options)
-                            driver.set_page_load_timeout(1200)
-                            session = Session(driver=driver)
-                            session.cookies.update(cookies)
-                            sessions.append(session)
-                            log_message(
-                                f"Loaded session for account {i}: {email}", "INFO"
-                            )
-                        except Exception as e:
-                            log_message(
-                                f"Failed to load session for {email}: {str(e)}", "ERROR"
-                            )
-                            driver = Chrome(options=options)
-                            driver.set_page_load_timeout(1200)
-                            if login(driver, email, password):
-                                session = Session(driver=driver)
-                                session.transfer_driver_cookies_to_session()
-                                sessions.append(session)
-                                save_session(session, session_filename)
-                                log_message(
-                                    f"Logged in and saved session for account {i}: {email}",
-                                    "INFO",
-                                )
-                            else:
-                                log_message(
-                                    f"Failed to login for account {i}: {email}",
-                                    "ERROR",
-                                )
-                    else:
-                        driver = Chrome(options=options)
-                        driver.set_page_load_timeout(1200)
-                        if login(driver, email, password):
-                            session = Session(driver=driver)
-                            session.transfer_driver_cookies_to_session()
-                            sessions.append(session)
-                            save_session(session, session_filename)
-                            log_message(
-                                f"Logged in and saved session for account {i}: {email}",
-                                "INFO",
-                            )
-                        else:
-                            log_message(
-                                f"Failed to login for account {i}: {email}", "ERROR"
-                            )
-
-                    driver.quit()
+                sessions = await login_accounts(account_sessions)
 
                 log_message("All accounts processed. Starting monitoring...", "INFO")
                 logged_in = True
@@ -281,53 +582,95 @@ async def monitor_feeds_async():
             if not market_is_open:
                 log_message("Market is open, starting monitoring...", "INFO")
                 market_is_open = True
+                poll_interval = POLL_INTERVAL_MIN
+                unchanged_polls = 0
+            next_poll = time.monotonic() + poll_interval
             try:
-                for session in sessions:
-                    session.headers.update({"User-Agent": get_random_user_agent()})
-                    alert_details = fetch_alert_details(session)
+                new_alert = False
+                active_sessions = [s for s in sessions if session_available(s)]
+                results = await asyncio.gather(
+                    *[fetch_alert_details(session) for session in active_sessions],
+                    return_exceptions=True,
+                )
+                for session, alert_details in zip(active_sessions, results):
+                    if isinstance(alert_details, Exception):
+                        record_session_result(
+                            session, account_sessions.index(session), alert_details
+                        )
+                        continue
+                    record_session_result(session, account_sessions.index(session))
+
                     if alert_details is None:
                         log_message("Current alert not interesting to us...", "INFO")
-                        await asyncio.sleep(0.7)
                         continue
 
-                    if alert_details["title"] != last_alert_details.get("title"):
+                    if is_new_alert(alert_details):
+                        new_alert = True
                         message = f"Title: {alert_details['title']}\nPrice: {alert_details['price']}\nCreated At: {alert_details['created_at']}\nCurrent Time: {alert_details['current_time']}"
-                        await send_telegram_message(
-                            message,
-                            HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN,
-                            HEDGEYE_SCRAPER_TELEGRAM_GRP,
-                        )
 
+                        title = alert_details["title"]
+                        title_folded = title.casefold()
                         signal_type = (
                             "Buy"
-                            if "buy" in alert_details["title"].lower()
-                            else (
-                                "Sell"
-                                if "sell" in alert_details["title"].lower()
-                                else "None"
-                            )
-                        )
-                        ticker_match = re.search(
-                            r"\b([A-Z]{1,5})\b(?=\s*\$)", alert_details["title"]
+                            if "buy" in title_folded
+                            else ("Sell" if "sell" in title_folded else "None")
                         )
+                        ticker_match = TICKER_RE.search(title)
                         ticker = ticker_match.group(0) if ticker_match else "-"
 
-                        await send_ws_message(
-                            {
-                                "name": "Hedgeye",
-                                "type": signal_type,
-                                "ticker": ticker,
-                                "sender": "hedgeye",
-                            },
-                            WS_SERVER_URL,
+                        # Independent sends: one failing must not hold up the other
+                        send_results = await asyncio.gather(
+                            send_telegram_message(
+                                message,
+                                HEDGEYE_SCRAPER_TELEGRAM_BOT_TOKEN,
+                                HEDGEYE_SCRAPER_TELEGRAM_GRP,
+                            ),
+                            send_ws_message(
+                                {
+                                    "name": "Hedgeye",
+                                    "type": signal_type,
+                                    "ticker": ticker,
+                                    "sender": "hedgeye",
+                                },
+                                WS_SERVER_URL,
+                            ),
+                            return_exceptions=True,
                         )
+                        telegram_result, ws_result = send_results
+                        # send_telegram_message logs its own errors and returns None
+                        if telegram_result is None:
+                            telegram_result = Exception("no response from Telegram")
+                        sent_via = []
+                        for channel, result in (
+                            ("Telegram", telegram_result),
+                            ("WebSocket", ws_result),
+                        ):
+                            if isinstance(result, Exception):
+                                log_message(
+                                    f"Failed to send alert via {channel}: {result}",
+                                    "ERROR",
+                                )
+                            else:
+                                sent_via.append(channel)
 
-                        log_message(f"New alert sent: {message}", "INFO")
-                        last_alert_details = {
-                            "title": alert_details["title"],
-                            "created_at": alert_details["created_at"],
-                        }
-                    await asyncio.sleep(0.6)
+                        if sent_via:
+                            log_message(
+                                f"New alert sent via {', '.join(sent_via)}: {message}",
+                                "INFO",
+                            )
+
+                # Poll fast while alerts are coming in, back off while the feed is quiet
+                if new_alert:
+                    poll_interval = POLL_INTERVAL_MIN
+                    unchanged_polls = 0
+                else:
+                    unchanged_polls += 1
+                    if unchanged_polls >= POLL_BACKOFF_AFTER:
+                        poll_interval = min(
+                            poll_interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX
+                        )
+                        unchanged_polls = 0
+                await asyncio.sleep(max(0, next_poll - time.monotonic()))
 
             except Exception as e:
                 log_message(f"Error during monitoring: {str(e)}", "ERROR")
@@ -338,5 +681,19 @@ async def monitor_feeds_async():
             await sleep_until_market_open()
 
 
+async def main():
+    validate_config()
+    # One connection pool shared by every account, each session keeping its own
+    # cookie jar, kept open for the lifetime of the process.
+    connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=75)
+    account_sessions = [create_session(connector) for _ in get_accounts()]
+    try:
+        await monitor_feeds_async(account_sessions)
+    finally:
+        for session in account_sessions:
+            await session.close()
+        await connector.close()
+
+
 if __name__ == "__main__":
-    asyncio.run(monitor_feeds_async())
+    asyncio.run(main())